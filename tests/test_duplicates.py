@@ -0,0 +1,69 @@
+from docx import Document
+
+from vinzy_codebase_to_docx import CodebaseConverter
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data)
+    return path
+
+
+def paragraphs(path):
+    return [p.text for p in Document(path).paragraphs if p.text]
+
+
+def convert(tmp_path, **kwargs):
+    converter = CodebaseConverter(str(tmp_path / 'src'), str(tmp_path / 'out.docx'),
+                                  include_toc=False, include_file_paths=False, **kwargs)
+    return converter.convert()
+
+
+def test_identical_files_are_referenced(tmp_path):
+    write(tmp_path / 'src' / 'a.txt', 'same\n')
+    write(tmp_path / 'src' / 'b.txt', 'same\n')
+
+    texts = paragraphs(convert(tmp_path))
+
+    assert texts.count('same\n') == 1
+    assert 'Duplicate of a.txt' in texts
+
+
+def test_duplicates_kept_when_disabled(tmp_path):
+    write(tmp_path / 'src' / 'a.txt', 'same\n')
+    write(tmp_path / 'src' / 'b.txt', 'same\n')
+
+    texts = paragraphs(convert(tmp_path, skip_duplicates=False))
+
+    assert texts.count('same\n') == 2
+
+
+def test_truncated_files_with_same_prefix_are_not_duplicates(tmp_path):
+    write(tmp_path / 'src' / 'a.txt', 'A' * 100 + 'tail one')
+    write(tmp_path / 'src' / 'b.txt', 'A' * 100 + 'tail two')
+
+    texts = paragraphs(convert(tmp_path, max_file_bytes=50))
+
+    assert not any(text.startswith('Duplicate of') for text in texts)
+    assert texts.count('A' * 50) == 2
+
+
+def test_duplicate_of_file_that_failed_is_embedded(tmp_path):
+    # lxml rejects the form feed, so the first copy is never embedded
+    write(tmp_path / 'src' / 'a.txt', 'bad \x0c text')
+    write(tmp_path / 'src' / 'b.txt', 'bad \x0c text')
+
+    texts = paragraphs(convert(tmp_path))
+
+    assert not any(text.startswith('Duplicate of') for text in texts)
+
+
+def test_duplicates_only_refer_to_same_part(tmp_path):
+    for name in 'abc':
+        write(tmp_path / 'src' / f'{name}.txt', 'same\n')
+
+    part1, part2 = convert(tmp_path, max_files_per_doc=2)
+
+    assert 'Duplicate of a.txt' in paragraphs(part1)
+    assert 'same\n' in paragraphs(part2)
+    assert not any(text.startswith('Duplicate of') for text in paragraphs(part2))
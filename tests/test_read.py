@@ -0,0 +1,212 @@
+import array
+from concurrent.futures import Future
+
+import pytest
+
+from vinzy_codebase_to_docx import CodebaseConverter
+from vinzy_codebase_to_docx import codebase_to_docx as module
+from vinzy_codebase_to_docx.codebase_to_docx import _read_utf8
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    path.write_bytes(data)
+    return path
+
+
+def read(path, max_bytes=None, file_size=None):
+    if file_size is None:
+        file_size = path.stat().st_size
+    return _read_utf8(str(path), file_size, max_bytes)
+
+
+def make_converter(tmp_path, **kwargs):
+    (tmp_path / 'src').mkdir(exist_ok=True)
+    return CodebaseConverter(str(tmp_path / 'src'), str(tmp_path / 'out.docx'), **kwargs)
+
+
+@pytest.fixture(params=['mmap', 'chunked'])
+def read_path(request, monkeypatch):
+    """Run a test against both the mmap and the chunked read path."""
+    if request.param == 'chunked':
+        monkeypatch.setattr(module, '_MMAP_LIMIT', 0)
+    return request.param
+
+
+# --- Reading in chunks ---
+
+def test_read_multibyte_character_split_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, '_MMAP_LIMIT', 0)
+    monkeypatch.setattr(module, '_CHUNK_SIZE', 3)
+    path = write(tmp_path / 'a.txt', 'é' * 10 + '€😀')
+
+    chunks, skipped, _ = read(path)
+
+    assert len(chunks) > 1
+    assert ''.join(chunks) == 'é' * 10 + '€😀'
+    assert skipped == 0
+
+
+def test_read_normalises_newlines(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', b'a\r\nb\rc\xc3\xa9\n')
+
+    chunks, skipped, _ = read(path)
+
+    assert ''.join(chunks) == 'a\nb\ncé\n'
+    assert skipped == 0
+
+
+def test_read_crlf_split_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, '_MMAP_LIMIT', 0)
+    monkeypatch.setattr(module, '_CHUNK_SIZE', 2)
+    path = write(tmp_path / 'a.txt', b'a\r\nb\r\nc')
+
+    chunks, _, _ = read(path)
+
+    assert ''.join(chunks) == 'a\nb\nc'
+
+
+# --- Binary files ---
+
+def test_read_detects_binary_file(tmp_path, read_path):
+    path = write(tmp_path / 'a.bin', b'abc\x00def')
+
+    assert read(path) == (None, 7, None)
+
+
+def test_read_ignores_nul_after_first_512_bytes(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', b'x' * 512 + b'\x00')
+
+    chunks, _, _ = read(path)
+
+    assert chunks is not None
+
+
+# --- Truncation ---
+
+def test_read_truncates_to_max_bytes(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', 'x' * 100)
+
+    chunks, skipped, _ = read(path, max_bytes=30)
+
+    assert ''.join(chunks) == 'x' * 30
+    assert skipped == 70
+
+
+def test_read_without_limit_reads_everything(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', 'x' * 100)
+
+    chunks, skipped, _ = read(path)
+
+    assert ''.join(chunks) == 'x' * 100
+    assert skipped == 0
+
+
+@pytest.mark.parametrize('max_file_bytes', [0, -1])
+def test_max_file_bytes_must_be_positive(tmp_path, max_file_bytes):
+    with pytest.raises(ValueError, match='max_file_bytes'):
+        make_converter(tmp_path, max_file_bytes=max_file_bytes)
+
+
+# --- Memory-mapped reads ---
+
+def test_read_file_grown_since_scan_is_still_truncated(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', 'x' * 500)
+
+    chunks, skipped, _ = read(path, max_bytes=50, file_size=10)
+
+    assert ''.join(chunks) == 'x' * 50
+    assert skipped == 450
+
+
+def test_read_file_emptied_since_scan(tmp_path, read_path):
+    path = write(tmp_path / 'a.txt', b'')
+
+    chunks, skipped, _ = read(path, file_size=10)
+
+    assert chunks == []
+    assert skipped == 0
+
+
+def test_read_digest_matches_between_paths(tmp_path, monkeypatch):
+    path = write(tmp_path / 'a.txt', 'print(1)\n' * 100)
+
+    mapped = read(path)
+    monkeypatch.setattr(module, '_MMAP_LIMIT', 0)
+    chunked = read(path)
+
+    assert mapped[2] == chunked[2]
+
+
+def test_read_falls_back_when_mmap_unsupported(tmp_path, monkeypatch):
+    def unsupported(*args, **kwargs):
+        raise OSError(19, 'No such device')
+
+    monkeypatch.setattr(module.mmap, 'mmap', unsupported)
+    path = write(tmp_path / 'a.txt', 'print(1)\n')
+
+    chunks, skipped, _ = read(path)
+
+    assert ''.join(chunks) == 'print(1)\n'
+    assert skipped == 0
+
+
+# --- Read-ahead window ---
+
+@pytest.mark.parametrize('read_workers', [0, -1])
+def test_read_workers_must_be_positive(tmp_path, read_workers):
+    with pytest.raises(ValueError, match='read_workers'):
+        make_converter(tmp_path, read_workers=read_workers)
+
+
+class RecordingPool:
+    """Stand-in executor that counts submitted reads without running them."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(None)
+        return future
+
+
+def read_ahead_windows(converter, sizes):
+    """Return how many reads are in flight as each file is handed over."""
+    pool = RecordingPool()
+    files = [f'{i}.py' for i in range(len(sizes))]
+    reads = converter._read_ahead(pool, files, array.array('q', sizes))
+    # Files before the current one have been consumed, so the rest of the
+    # submitted reads (including the current file's) are in the window
+    return [pool.submitted - consumed for consumed, _ in enumerate(reads)]
+
+
+def test_read_ahead_window_limited_by_file_count(tmp_path, monkeypatch):
+    monkeypatch.setattr(CodebaseConverter, 'READ_AHEAD', 3)
+    converter = make_converter(tmp_path, read_workers=1)
+
+    assert read_ahead_windows(converter, [10] * 6) == [3, 3, 3, 3, 2, 1]
+
+
+def test_read_ahead_window_limited_by_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(CodebaseConverter, 'READ_AHEAD_BYTES', 25)
+    converter = make_converter(tmp_path)
+
+    assert read_ahead_windows(converter, [10] * 6) == [2, 2, 2, 2, 2, 1]
+
+
+def test_read_ahead_budget_smaller_than_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(CodebaseConverter, 'READ_AHEAD_BYTES', 1)
+    converter = make_converter(tmp_path)
+
+    assert read_ahead_windows(converter, [10] * 5) == [1] * 5
+
+
+def test_read_ahead_counts_truncated_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(CodebaseConverter, 'READ_AHEAD_BYTES', 25)
+    converter = make_converter(tmp_path, max_file_bytes=5)
+
+    assert read_ahead_windows(converter, [1000] * 6) == [5, 5, 4, 3, 2, 1]
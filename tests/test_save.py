@@ -0,0 +1,94 @@
+import struct
+import zipfile
+
+import pytest
+from docx import Document
+
+from vinzy_codebase_to_docx import CodebaseConverter
+from vinzy_codebase_to_docx import codebase_to_docx as module
+from vinzy_codebase_to_docx.codebase_to_docx import _save_docx
+
+# Local file header: signature, version needed, flags, method, time, date,
+# CRC, compressed size, uncompressed size, name length, extra length
+_LOCAL_HEADER = struct.Struct('<4sHHHHHLLLHH')
+
+
+def zip_headers(path):
+    """Return (name, central extract version, local version, local extra length)."""
+    headers = []
+    with zipfile.ZipFile(path) as zf, open(path, 'rb') as f:
+        for info in zf.infolist():
+            f.seek(info.header_offset)
+            fields = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+            headers.append((info.filename, info.extract_version, fields[1], fields[10]))
+    return headers
+
+
+def make_document():
+    doc = Document()
+    doc.add_paragraph('print(1)')
+    return doc
+
+
+def test_save_uses_plain_zip_headers(tmp_path):
+    _save_docx(make_document(), str(tmp_path / 'streamed.docx'))
+    make_document().save(str(tmp_path / 'saved.docx'))
+
+    streamed = zip_headers(tmp_path / 'streamed.docx')
+    saved = zip_headers(tmp_path / 'saved.docx')
+
+    assert sorted(name for name, *_ in streamed) == sorted(name for name, *_ in saved)
+    for headers in (streamed, saved):
+        for name, extract_version, local_version, extra_length in headers:
+            assert (extract_version, local_version, extra_length) == (20, 20, 0), name
+
+
+def test_save_zip64_only_for_document_part(tmp_path):
+    path = tmp_path / 'out.docx'
+    _save_docx(make_document(), str(path), zip64=True)
+
+    for name, extract_version, local_version, extra_length in zip_headers(path):
+        if name == 'word/document.xml':
+            assert local_version == 45
+            assert extra_length > 0
+        else:
+            assert (extract_version, local_version, extra_length) == (20, 20, 0), name
+    assert 'print(1)' in [p.text for p in Document(path).paragraphs]
+
+
+def test_save_falls_back_without_docx_internals(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, '_STREAMING_SAVE', False)
+    path = tmp_path / 'out.docx'
+
+    _save_docx(make_document(), str(path))
+
+    assert 'print(1)' in [p.text for p in Document(path).paragraphs]
+
+
+def test_save_does_not_hide_writer_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(module, '_ContentTypesItem', object())
+
+    with pytest.raises(AttributeError):
+        _save_docx(make_document(), str(tmp_path / 'out.docx'))
+
+
+def test_save_compresslevel(tmp_path):
+    doc = Document()
+    for i in range(200):
+        doc.add_paragraph(f'def function_{i}(value):\n    return value * {i}\n')
+
+    _save_docx(doc, str(tmp_path / 'fast.docx'), compresslevel=1)
+    _save_docx(doc, str(tmp_path / 'small.docx'), compresslevel=9)
+
+    with zipfile.ZipFile(tmp_path / 'fast.docx') as fast, \
+            zipfile.ZipFile(tmp_path / 'small.docx') as small:
+        fast_size = fast.getinfo('word/document.xml').compress_size
+        small_size = small.getinfo('word/document.xml').compress_size
+        assert fast.read('word/document.xml') == small.read('word/document.xml')
+    assert small_size < fast_size
+
+
+@pytest.mark.parametrize('compresslevel', [-1, 10])
+def test_compresslevel_must_be_in_range(tmp_path, compresslevel):
+    with pytest.raises(ValueError, match='compresslevel'):
+        CodebaseConverter(str(tmp_path), compresslevel=compresslevel)
@@ -0,0 +1,126 @@
+import os
+
+from vinzy_codebase_to_docx import CodebaseConverter
+
+
+def write(path, data=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data)
+    return path
+
+
+def scan(root, **kwargs):
+    """Return the scanned files relative to root, with their sizes."""
+    files, sizes = CodebaseConverter(str(root), **kwargs)._get_files()
+    rel_paths = [os.path.relpath(path, root).replace(os.sep, '/') for path in files]
+    return dict(zip(rel_paths, sizes)), rel_paths
+
+
+def test_scan_finds_nested_files_with_sizes(tmp_path):
+    write(tmp_path / 'a.py', 'x = 1\n')
+    write(tmp_path / 'pkg' / 'sub' / 'b.js', 'let b;\n')
+
+    sizes, _ = scan(tmp_path)
+
+    assert sizes == {'a.py': 6, 'pkg/sub/b.js': 7}
+
+
+def test_scan_prunes_default_ignored_dirs(tmp_path):
+    write(tmp_path / 'a.py')
+    for name in ('node_modules', '.git', 'build', '__pycache__'):
+        write(tmp_path / name / 'x.py')
+    write(tmp_path / 'src' / 'node_modules' / 'y.py')
+
+    _, files = scan(tmp_path)
+
+    assert files == ['a.py']
+
+
+def test_scan_prunes_user_ignored_dirs(tmp_path):
+    write(tmp_path / 'a.py')
+    write(tmp_path / 'docs' / 'b.py')
+    write(tmp_path / 'build' / 'c.py')
+
+    _, files = scan(tmp_path, ignore_dirs={'docs'})
+
+    assert files == ['a.py']
+
+
+def test_scan_only_ignores_directories(tmp_path):
+    write(tmp_path / 'build.py')
+
+    _, files = scan(tmp_path)
+
+    assert files == ['build.py']
+
+
+def test_scan_matches_extensions_case_insensitively(tmp_path):
+    write(tmp_path / 'a.PY')
+    write(tmp_path / 'b.Js')
+    write(tmp_path / 'c.png')
+
+    _, files = scan(tmp_path)
+
+    assert files == ['a.PY', 'b.Js']
+
+
+def test_scan_upper_case_include_extensions(tmp_path):
+    write(tmp_path / 'a.py')
+    write(tmp_path / 'b.js')
+
+    _, files = scan(tmp_path, include_extensions={'.PY'})
+
+    assert files == ['a.py']
+
+
+def test_scan_skips_dotfiles_and_extensionless_files(tmp_path):
+    write(tmp_path / '.py')
+    write(tmp_path / '.bashrc')
+    write(tmp_path / 'Makefile')
+    write(tmp_path / 'a.py')
+
+    _, files = scan(tmp_path)
+
+    assert files == ['a.py']
+
+
+def test_scan_skips_unreadable_directories(tmp_path, monkeypatch):
+    write(tmp_path / 'a.py')
+    write(tmp_path / 'locked' / 'b.py')
+    write(tmp_path / 'open' / 'c.py')
+
+    real_scandir = os.scandir
+    locked = str(tmp_path / 'locked')
+
+    def scandir(path):
+        if os.fspath(path) == locked:
+            raise PermissionError(13, 'Permission denied', path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir)
+
+    _, files = scan(tmp_path)
+
+    assert files == ['a.py', 'open/c.py']
+
+
+def test_scan_sorts_by_path_components(tmp_path):
+    for name in ('a.py', 'a-b.py', 'a/b.py', 'a/a/z.py', 'B.py'):
+        write(tmp_path / name)
+
+    _, files = scan(tmp_path)
+
+    # Same order as sorting Path objects: a directory's files come before
+    # siblings that only share a prefix with its name
+    assert files == ['B.py', 'a/a/z.py', 'a/b.py', 'a-b.py', 'a.py']
+
+
+def test_scan_sort_follows_normcase(tmp_path, monkeypatch):
+    # Windows normcase lower-cases paths, so Path sorts case-insensitively there
+    for name in ('a.py', 'B.py', 'c.py'):
+        write(tmp_path / name)
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+
+    _, files = scan(tmp_path)
+
+    assert files == ['a.py', 'B.py', 'c.py']
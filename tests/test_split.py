@@ -0,0 +1,94 @@
+import array
+
+import pytest
+from docx import Document
+
+from vinzy_codebase_to_docx import CodebaseConverter
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data)
+    return path
+
+
+def paragraphs(path):
+    return [p.text for p in Document(path).paragraphs if p.text]
+
+
+def make_converter(tmp_path, **kwargs):
+    (tmp_path / 'src').mkdir(exist_ok=True)
+    return CodebaseConverter(str(tmp_path / 'src'), str(tmp_path / 'out.docx'), **kwargs)
+
+
+def test_split_files_not_split_by_default(tmp_path):
+    converter = make_converter(tmp_path)
+    files = ['a', 'b', 'c']
+
+    assert converter._split_files(files, array.array('q', [1, 2, 3])) == [files]
+
+
+def test_split_files_by_file_count(tmp_path):
+    converter = make_converter(tmp_path, max_files_per_doc=2)
+    files = ['a', 'b', 'c', 'd', 'e']
+
+    parts = converter._split_files(files, array.array('q', [1] * 5))
+
+    assert parts == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_split_files_by_bytes(tmp_path):
+    converter = make_converter(tmp_path, max_bytes_per_doc=10)
+    files = ['a', 'b', 'c', 'd']
+
+    parts = converter._split_files(files, array.array('q', [4, 6, 5, 5]))
+
+    assert parts == [['a', 'b'], ['c', 'd']]
+
+
+def test_split_files_oversized_file_gets_own_part(tmp_path):
+    converter = make_converter(tmp_path, max_bytes_per_doc=10)
+    files = ['a', 'big', 'b']
+
+    parts = converter._split_files(files, array.array('q', [4, 50, 4]))
+
+    assert parts == [['a'], ['big'], ['b']]
+
+
+def test_split_files_counts_truncated_size(tmp_path):
+    converter = make_converter(tmp_path, max_bytes_per_doc=10, max_file_bytes=5)
+    files = ['a', 'b', 'c']
+
+    parts = converter._split_files(files, array.array('q', [100, 100, 100]))
+
+    assert parts == [['a', 'b'], ['c']]
+
+
+def test_split_files_both_limits(tmp_path):
+    converter = make_converter(tmp_path, max_files_per_doc=2, max_bytes_per_doc=10)
+    files = ['a', 'b', 'c', 'd', 'e']
+
+    parts = converter._split_files(files, array.array('q', [1, 1, 2, 9, 1]))
+
+    assert parts == [['a', 'b'], ['c'], ['d', 'e']]
+
+
+@pytest.mark.parametrize('option', ['max_files_per_doc', 'max_bytes_per_doc'])
+def test_limits_must_be_positive(tmp_path, option):
+    with pytest.raises(ValueError, match=option):
+        make_converter(tmp_path, **{option: 0})
+
+
+def test_convert_writes_numbered_parts(tmp_path):
+    for name in 'abc':
+        write(tmp_path / 'src' / f'{name}.py', f'{name} = 1\n')
+
+    paths = make_converter(tmp_path, max_files_per_doc=2).convert()
+
+    assert paths == [str(tmp_path / 'out_part1.docx'), str(tmp_path / 'out_part2.docx')]
+    part1, part2 = (paragraphs(path) for path in paths)
+    assert part1[0] == 'Codebase: src (part 1 of 2)'
+    assert 'Files in this part: 2 of 3' in part1
+    assert ['a = 1\n', 'b = 1\n'] == [text for text in part1 if text.endswith('= 1\n')]
+    assert part2[0] == 'Codebase: src (part 2 of 2)'
+    assert ['c = 1\n'] == [text for text in part2 if text.endswith('= 1\n')]
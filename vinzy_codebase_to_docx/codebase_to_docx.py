@@ -2,16 +2,28 @@
 codebase_to_docx: Convert your entire codebase to a Word document
 """
 
+import array
+import codecs
+import copy
+import hashlib
+import io
+import mmap
 import os
 import sys
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 # Fix for docx import issues
 try:
     from docx import Document
-    from docx.shared import Pt, RGBColor, Inches
+    from docx.shared import Pt, Inches
     from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.oxml import OxmlElement, parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from lxml import etree
 except ImportError as e:
     print("ERROR: python-docx is not installed correctly.")
     print("\nPlease run these commands:")
@@ -20,7 +32,200 @@ except ImportError as e:
     print(f"\nOriginal error: {e}")
     sys.exit(1)
 
-import mimetypes
+# Packaging internals used to stream the saved document. They are not part
+# of python-docx's public API, so check for them once here and fall back to
+# Document.save() if this version does not provide them.
+try:
+    from docx.opc.package import OpcPackage
+    from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+    from docx.opc.part import Part, XmlPart
+    from docx.opc.pkgwriter import _ContentTypesItem
+    _STREAMING_SAVE = all((
+        hasattr(OpcPackage, 'parts'),
+        hasattr(Part, 'before_marshal'),
+        hasattr(XmlPart, 'element'),
+        hasattr(PackURI, 'rels_uri'),
+        hasattr(_ContentTypesItem, 'from_parts'),
+    ))
+except ImportError:
+    _STREAMING_SAVE = False
+
+# Tags used while building paragraphs, resolved once rather than per node
+_W_SECTPR = qn('w:sectPr')
+_W_R = qn('w:r')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TAB = qn('w:tab')
+_PRESERVE = {qn('xml:space'): 'preserve'}
+
+# Run properties shared by every code block: Courier New, 9pt (half-points)
+_CODE_RPR = parse_xml(
+    '<w:rPr %s><w:rFonts w:ascii="Courier New" w:hAnsi="Courier New"/>'
+    '<w:sz w:val="18"/></w:rPr>' % nsdecls('w')
+)
+
+# Run properties for table of contents entries: 10pt
+_TOC_RPR = parse_xml('<w:rPr %s><w:sz w:val="20"/></w:rPr>' % nsdecls('w'))
+
+# Run properties for read errors: red
+_ERROR_RPR = parse_xml('<w:rPr %s><w:color w:val="FF0000"/></w:rPr>' % nsdecls('w'))
+
+# Run properties for notes such as the "Location:" line: 9pt, grey, italic
+_NOTE_RPR = parse_xml(
+    '<w:rPr %s><w:i/><w:color w:val="808080"/><w:sz w:val="18"/></w:rPr>'
+    % nsdecls('w')
+)
+
+
+def _append_body(body, element):
+    """Append an element to the document body, keeping w:sectPr last."""
+    last = next(body.iterchildren(reversed=True), None)
+    if last is not None and last.tag == _W_SECTPR:
+        last.addprevious(element)
+    else:
+        body.append(element)
+
+
+def _append_paragraph(body, text=None, ppr=None, rpr=None):
+    """Append a single-run paragraph, copying in the given pPr/rPr templates."""
+    p = OxmlElement('w:p')
+    _append_body(body, p)
+    if ppr is not None:
+        p.append(copy.deepcopy(ppr))
+    if text is not None:
+        r = etree.SubElement(p, _W_R)
+        if rpr is not None:
+            r.append(copy.deepcopy(rpr))
+        etree.SubElement(r, _W_T, _PRESERVE).text = text
+    return p
+
+
+def _save_docx(doc: Document, output_path: str, compresslevel: int = 1,
+               zip64: bool = False):
+    """
+    Save a document, streaming its XML parts straight into the zip.
+    
+    Writes the same package as Document.save(), but each XML part is
+    serialized incrementally into its zip entry instead of first being
+    built as one bytes object, which for document.xml can be very large.
+    Level 1 deflate is the default: it saves faster than level 6, which
+    Document.save() uses, at the cost of files around a quarter larger for
+    typical code listings.
+    
+    Parts get plain zip headers, as with Document.save(); Office asks to
+    repair files whose entries carry Zip64 headers they do not need. Set
+    zip64 when document.xml may exceed 4 GiB to give it Zip64 headers.
+    
+    Falls back to Document.save(), and its compression level, if the
+    installed python-docx does not provide the packaging internals this
+    relies on.
+    """
+    if not _STREAMING_SAVE:
+        doc.save(output_path)
+        return
+    _write_package(doc.part.package, output_path, compresslevel,
+                   zip64_part=doc.part if zip64 else None)
+
+
+def _write_package(package, output_path: str, compresslevel: int, zip64_part=None):
+    """Write a python-docx package to output_path, one zip entry per part."""
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel) as zf:
+        zf.writestr(CONTENT_TYPES_URI.membername,
+                    _ContentTypesItem.from_parts(parts).blob)
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+        for part in parts:
+            name = part.partname.membername
+            if isinstance(part, XmlPart):
+                with zf.open(name, 'w', force_zip64=part is zip64_part) as f:
+                    etree.ElementTree(part.element).write(
+                        f, encoding='UTF-8', standalone=True
+                    )
+            else:
+                zf.writestr(name, part.blob)
+            if len(part.rels):
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+
+# Upper bound on how much larger a file's content gets once written into
+# document.xml: markup escaping, <w:tab/> and <w:br/> elements for tabs and
+# line breaks, and the heading and note paragraphs around short files
+_XML_EXPANSION = 8
+_XML_PER_FILE = 4096
+
+# Size of the text chunks files are read in
+_CHUNK_SIZE = 64 * 1024
+
+# Files up to this size are memory-mapped and decoded in one go
+_MMAP_LIMIT = 1024 * 1024
+
+
+def _read_utf8(file_path: str, file_size: int, max_bytes: Optional[int] = None
+               ) -> Tuple[Optional[List[str]], int, Optional[bytes]]:
+    """
+    Read up to max_bytes of a file as UTF-8 text in chunks.
+    
+    file_size is the size recorded when the codebase was scanned. Undecodable
+    bytes are dropped and newlines are normalised to '\n', as in text mode.
+    Returns the text chunks, the number of bytes skipped and a BLAKE2 digest
+    of the bytes read. Binary files (a NUL byte in the first 512 bytes) are
+    not decoded: the chunks and digest are None and the whole file counts
+    as skipped.
+    """
+    # The incremental decoder keeps multibyte characters intact across
+    # chunk boundaries, while the limit is applied to raw bytes.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder('utf-8')(errors='ignore'), translate=True
+    )
+    with open(file_path, 'rb', buffering=1 << 20) as f:
+        # Small files (the common case) are decoded straight from a read-only
+        # mapping, skipping the copy into a user-space read buffer
+        if 0 < file_size <= _MMAP_LIMIT and (max_bytes is None or file_size <= max_bytes):
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Emptied since the scan, or on a filesystem that cannot map
+                mm = None
+            if mm is not None:
+                with mm:
+                    # The limits were checked against the scanned size, so
+                    # only map files that have not changed size since then
+                    if len(mm) == file_size:
+                        if mm.find(b'\x00', 0, 512) != -1:
+                            return None, file_size, None
+                        digest = hashlib.blake2b(mm, digest_size=16).digest()
+                        text = decoder.decode(mm, final=True)
+                        return ([text] if text else []), 0, digest
+        
+        chunks = []
+        read = 0
+        hasher = hashlib.blake2b(digest_size=16)
+        while max_bytes is None or read < max_bytes:
+            size = _CHUNK_SIZE if max_bytes is None else min(_CHUNK_SIZE, max_bytes - read)
+            data = f.read(size)
+            if not data:
+                break
+            if not read and b'\x00' in data[:512]:
+                return None, file_size, None
+            read += len(data)
+            hasher.update(data)
+            text = decoder.decode(data)
+            if text:
+                chunks.append(text)
+        text = decoder.decode(b'', final=True)
+        if text:
+            chunks.append(text)
+        
+        skipped = 0
+        if max_bytes is not None and read >= max_bytes:
+            # Measure what is left now, as the file may have grown since the scan
+            skipped = max(os.fstat(f.fileno()).st_size - read, 0)
+    return chunks, skipped, hasher.digest()
+
 
 class CodebaseConverter:
     """Convert a codebase directory to a Word document."""
@@ -40,13 +245,32 @@ class CodebaseConverter:
         '.gradle', 'bin', 'obj', 'coverage'
     }
     
+    # Number of files read ahead of the one being written to the document
+    READ_AHEAD = 64
+    
+    # Upper bound on the file bytes held by reads in flight or waiting to be
+    # written (a single larger file is still read on its own)
+    READ_AHEAD_BYTES = 32 * 1024 * 1024
+    
+    # Print a progress line every this many files
+    PROGRESS_INTERVAL = 64
+    
+    # Number of threads scanning directories
+    SCAN_WORKERS = min(8, os.cpu_count() or 1)
+    
     def __init__(self, 
                  codebase_path: str,
                  output_path: str = 'codebase.docx',
                  include_file_paths: bool = True,
                  include_toc: bool = True,
                  ignore_dirs: Optional[Set[str]] = None,
-                 include_extensions: Optional[Set[str]] = None):
+                 include_extensions: Optional[Set[str]] = None,
+                 read_workers: Optional[int] = None,
+                 max_file_bytes: Optional[int] = 2 * 1024 * 1024,
+                 max_files_per_doc: Optional[int] = None,
+                 max_bytes_per_doc: Optional[int] = None,
+                 skip_duplicates: bool = True,
+                 compresslevel: int = 1):
         """
         Initialize the converter.
         
@@ -57,109 +281,301 @@ class CodebaseConverter:
             include_toc: Whether to include a table of contents
             ignore_dirs: Additional directories to ignore
             include_extensions: Specific file extensions to include (None = use defaults)
+            read_workers: Number of files read concurrently (None = based on CPU count)
+            max_file_bytes: Files larger than this are truncated (None = no limit)
+            max_files_per_doc: Split the output into several documents of at
+                most this many files each (None = no limit)
+            max_bytes_per_doc: Split the output into several documents of at
+                most this many bytes of file content each (None = no limit)
+            skip_duplicates: Whether files identical to one already included
+                are replaced by a reference to it
+            compresslevel: Deflate level of the saved document, 0-9 (1 is
+                fastest; higher levels give smaller files)
         """
         self.codebase_path = Path(codebase_path).resolve()
+        # Scanned paths all start with the base directory and a separator;
+        # slicing that prefix off is much cheaper than os.path.relpath.
+        self._base_len = len(str(self.codebase_path).rstrip(os.sep)) + len(os.sep)
         self.output_path = output_path
         self.include_file_paths = include_file_paths
         self.include_toc = include_toc
         
         # Setup ignore directories
-        self.ignore_dirs = self.IGNORE_DIRS.copy()
-        if ignore_dirs:
-            self.ignore_dirs.update(ignore_dirs)
+        self.ignore_dirs = frozenset(self.IGNORE_DIRS.union(ignore_dirs or ()))
+        
+        # Setup file extensions (lower-cased to match the scan-time check)
+        self.include_extensions = frozenset(
+            ext.lower() for ext in (include_extensions or self.CODE_EXTENSIONS)
+        )
+        
+        # Setup concurrent reads
+        self.read_workers = read_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.max_file_bytes = max_file_bytes
+        
+        # Setup output splitting
+        self.max_files_per_doc = max_files_per_doc
+        self.max_bytes_per_doc = max_bytes_per_doc
         
-        # Setup file extensions
-        self.include_extensions = include_extensions or self.CODE_EXTENSIONS
+        # Setup duplicate detection: content digest -> relative path, for
+        # the files embedded in the document being built
+        self.skip_duplicates = skip_duplicates
+        self._seen_content: Dict[bytes, str] = {}
+        
+        self.compresslevel = compresslevel
         
         # Validate paths
         if not self.codebase_path.exists():
             raise ValueError(f"Codebase path does not exist: {codebase_path}")
         if not self.codebase_path.is_dir():
             raise ValueError(f"Codebase path is not a directory: {codebase_path}")
+        if read_workers is not None and read_workers < 1:
+            raise ValueError(f"read_workers must be at least 1: {read_workers}")
+        if max_file_bytes is not None and max_file_bytes < 1:
+            raise ValueError(f"max_file_bytes must be at least 1: {max_file_bytes}")
+        if max_files_per_doc is not None and max_files_per_doc < 1:
+            raise ValueError(f"max_files_per_doc must be at least 1: {max_files_per_doc}")
+        if max_bytes_per_doc is not None and max_bytes_per_doc < 1:
+            raise ValueError(f"max_bytes_per_doc must be at least 1: {max_bytes_per_doc}")
+        if not 0 <= compresslevel <= 9:
+            raise ValueError(f"compresslevel must be between 0 and 9: {compresslevel}")
+    
+    def _scan_dir(self, path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """Scan one directory, returning its included (file, size) pairs and subdirectories."""
+        files: List[Tuple[str, int]] = []
+        subdirs: List[str] = []
+        # Bind the lookups used per entry once, outside the loop
+        is_ignored = self.ignore_dirs.__contains__
+        is_included = self.include_extensions.__contains__
+        add_file = files.append
+        add_subdir = subdirs.append
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune ignored directories before descending
+                        if not is_ignored(name):
+                            add_subdir(entry.path)
+                    elif entry.is_file():
+                        dot = name.rfind('.')
+                        if dot > 0 and is_included(name[dot:].lower()):
+                            # Record the size now so later passes need no stat
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                size = 0
+                            add_file((entry.path, size))
+        except OSError:
+            # Unreadable directories are skipped, as os.walk did
+            pass
+        return files, subdirs
     
-    def _should_include_file(self, file_path: Path) -> bool:
-        """Check if a file should be included in the document."""
-        # Check extension
-        if file_path.suffix.lower() not in self.include_extensions:
-            return False
+    def _get_files(self) -> Tuple[List[str], array.array]:
+        """
+        Get all files to include in the document, in sorted order.
         
-        # Check if in ignored directory
-        for parent in file_path.parents:
-            if parent.name in self.ignore_dirs:
-                return False
+        Returns the file paths and, in a parallel array, their sizes.
+        """
+        # Directories are scanned in parallel; os.scandir releases the GIL
+        # while reading entries, so slow or cold directories overlap.
+        files = []
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            pending = {pool.submit(self._scan_dir, str(self.codebase_path))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    files.extend(found)
+                    pending.update(pool.submit(self._scan_dir, d) for d in subdirs)
         
-        return True
+        # Sort by path components, the same order as sorting Path objects
+        # (normcase makes it case-insensitive on Windows, as Path is there)
+        base_len = self._base_len
+        files.sort(key=lambda item: os.path.normcase(item[0][base_len:]).split(os.sep))
+        paths = [path for path, _ in files]
+        sizes = array.array('q', (size for _, size in files))
+        return paths, sizes
     
-    def _get_files(self) -> List[Path]:
-        """Get all files to include in the document."""
-        files = []
-        for root, dirs, filenames in os.walk(self.codebase_path):
-            # Remove ignored directories from dirs list
-            dirs[:] = [d for d in dirs if d not in self.ignore_dirs]
+    @property
+    def _is_split(self) -> bool:
+        """Whether the output is split across several documents."""
+        return self.max_files_per_doc is not None or self.max_bytes_per_doc is not None
+    
+    def _split_files(self, files: List[str], sizes: array.array) -> List[List[str]]:
+        """Group files into one list per output document."""
+        if not self._is_split:
+            return [files]
+        
+        parts: List[List[str]] = [[]]
+        part_bytes = 0
+        for file_path, size in zip(files, sizes):
+            if self.max_file_bytes is not None:
+                size = min(size, self.max_file_bytes)
             
-            for filename in filenames:
-                file_path = Path(root) / filename
-                if self._should_include_file(file_path):
-                    files.append(file_path)
+            # Start a new part once a limit would be exceeded; a file larger
+            # than max_bytes_per_doc still gets a part of its own
+            part = parts[-1]
+            if part and (
+                (self.max_files_per_doc is not None
+                 and len(part) >= self.max_files_per_doc)
+                or (self.max_bytes_per_doc is not None
+                    and part_bytes + size > self.max_bytes_per_doc)
+            ):
+                part = []
+                parts.append(part)
+                part_bytes = 0
+            part.append(file_path)
+            part_bytes += size
+        return parts
+    
+    def _part_path(self, part_no: int) -> str:
+        """Return the output path for one part of a split document."""
+        root, ext = os.path.splitext(self.output_path)
+        return f"{root}_part{part_no}{ext}"
+    
+    def _create_document(self, files: List[str], title: str, summary: str) -> Document:
+        """Create a document with its title page and table of contents."""
+        doc = Document()
         
-        return sorted(files)
+        # Set default font
+        style = doc.styles['Normal']
+        font = style.font
+        font.name = 'Calibri'
+        font.size = Pt(11)
+        
+        # Start every level-1 heading (table of contents and each file) on
+        # a new page, rather than adding a page-break paragraph before each
+        doc.styles['Heading 1'].paragraph_format.page_break_before = True
+        
+        # Add title
+        self._add_title(doc, title)
+        doc.add_paragraph(summary)
+        
+        # Add table of contents
+        if self.include_toc:
+            self._add_table_of_contents(doc, files)
+        
+        return doc
     
     def _add_title(self, doc: Document, title: str):
         """Add a title to the document."""
         heading = doc.add_heading(title, level=0)
         heading.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
     
-    def _add_table_of_contents(self, doc: Document, files: List[Path]):
+    def _add_table_of_contents(self, doc: Document, files: List[str]):
         """Add a table of contents listing all files."""
         doc.add_heading('Table of Contents', level=1)
         
+        # Resolve the bullet style once and stamp copies of it onto each
+        # entry, instead of add_paragraph(style=...) and run.font per file
+        style_id = doc.styles['List Bullet'].style_id
+        toc_ppr = parse_xml(
+            '<w:pPr %s><w:pStyle w:val="%s"/></w:pPr>' % (nsdecls('w'), style_id)
+        )
+        body = doc.element.body
         for file_path in files:
-            rel_path = file_path.relative_to(self.codebase_path)
-            p = doc.add_paragraph(str(rel_path), style='List Bullet')
-            # Make it smaller
-            for run in p.runs:
-                run.font.size = Pt(10)
-        
-        doc.add_page_break()
+            rel_path = file_path[self._base_len:]
+            _append_paragraph(body, rel_path, ppr=toc_ppr, rpr=_TOC_RPR)
     
-    def _add_file_content(self, doc: Document, file_path: Path):
-        """Add a single file's content to the document."""
-        rel_path = file_path.relative_to(self.codebase_path)
+    def _add_code_paragraph(self, doc: Document, chunks: Iterable[str]):
+        """Add a code block as a raw w:p element, bypassing the Paragraph/Run API."""
+        # Attach the paragraph before filling it: moving a large finished
+        # subtree into the document makes lxml revisit every node.
+        p = _append_paragraph(doc.element.body)
+        try:
+            r = etree.SubElement(p, _W_R)
+            r.append(copy.deepcopy(_CODE_RPR))
+            
+            # Line breaks and tabs become w:br / w:tab, as Paragraph.add_run
+            # would do. A line split across two chunks spans two w:t elements.
+            for text in chunks:
+                for line_no, line in enumerate(text.split('\n')):
+                    if line_no:
+                        etree.SubElement(r, _W_BR)
+                    for tab_no, part in enumerate(line.split('\t')):
+                        if tab_no:
+                            etree.SubElement(r, _W_TAB)
+                        if part:
+                            etree.SubElement(r, _W_T, _PRESERVE).text = part
+        except Exception:
+            p.getparent().remove(p)
+            raise
+    
+    def _add_file_content(self, doc: Document, file_path: str, content: Future):
+        """Add a single file's content (read in the background) to the document."""
+        rel_path = file_path[self._base_len:]
         
         # Add file heading
-        doc.add_heading(str(rel_path), level=1)
+        doc.add_heading(rel_path, level=1)
+        
+        body = doc.element.body
         
         # Add file path if requested
         if self.include_file_paths:
-            p = doc.add_paragraph()
-            run = p.add_run(f"Location: {file_path}")
-            run.font.size = Pt(9)
-            run.font.color.rgb = RGBColor(128, 128, 128)
-            run.italic = True
+            _append_paragraph(body, f"Location: {file_path}", rpr=_NOTE_RPR)
         
-        # Read and add file content
+        # Add file content once its read has finished
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            chunks, skipped, digest = content.result()
             
-            # Add code block
-            p = doc.add_paragraph()
-            run = p.add_run(content)
-            run.font.name = 'Courier New'
-            run.font.size = Pt(9)
+            # Empty files are not worth a cross-reference, and the digest of
+            # a truncated file only covers the part that was read
+            check_duplicate = self.skip_duplicates and chunks and not skipped
+            duplicate_of = self._seen_content.get(digest) if check_duplicate else None
+            
+            if chunks is None:
+                _append_paragraph(body, f"[binary file, {skipped} bytes, not included]",
+                                  rpr=_NOTE_RPR)
+            elif duplicate_of is not None:
+                _append_paragraph(body, f"Duplicate of {duplicate_of}", rpr=_NOTE_RPR)
+            else:
+                # Add code block
+                self._add_code_paragraph(doc, chunks)
+                if check_duplicate:
+                    # Only once the content is really in the document
+                    self._seen_content[digest] = rel_path
+                if skipped:
+                    _append_paragraph(body, f"... [truncated {skipped} bytes]",
+                                      rpr=_NOTE_RPR)
             
             # Add light gray background (simulating code block)
             # Note: python-docx doesn't support full background shading,
             # but we can make the font distinctive
             
         except Exception as e:
-            p = doc.add_paragraph()
-            run = p.add_run(f"Error reading file: {str(e)}")
-            run.font.color.rgb = RGBColor(255, 0, 0)
+            _append_paragraph(body, f"Error reading file: {str(e)}", rpr=_ERROR_RPR)
         
-        doc.add_paragraph()  # Add spacing
+        _append_paragraph(body)  # Add spacing
+    
+    def _read_ahead(self, pool: ThreadPoolExecutor, files: List[str],
+                    sizes: array.array) -> Iterator[Future]:
+        """Yield each file's read, in order, while keeping later reads in flight."""
+        # The window is bounded by file count, so every worker can keep a
+        # read in flight, and by bytes, so decoded files waiting to be
+        # written cannot pile up in memory.
+        read_ahead = max(self.READ_AHEAD, self.read_workers)
+        pending: Deque[Tuple[Future, int]] = deque()
+        pending_bytes = 0
+        next_idx = 0
+        while next_idx < len(files) or pending:
+            while next_idx < len(files) and len(pending) < read_ahead:
+                cost = sizes[next_idx]
+                if self.max_file_bytes is not None:
+                    cost = min(cost, self.max_file_bytes)
+                if pending and pending_bytes + cost > self.READ_AHEAD_BYTES:
+                    break
+                future = pool.submit(_read_utf8, files[next_idx], sizes[next_idx],
+                                     self.max_file_bytes)
+                pending.append((future, cost))
+                pending_bytes += cost
+                next_idx += 1
+            
+            future, cost = pending.popleft()
+            yield future
+            # The consumer is done with this file once it asks for the next
+            pending_bytes -= cost
     
-    def convert(self, progress_callback=None) -> str:
+    def convert(self, progress_callback=None) -> Union[str, List[str]]:
         """
         Convert the codebase to a Word document.
         
@@ -167,51 +583,68 @@ class CodebaseConverter:
             progress_callback: Optional callback function(current, total, filename)
         
         Returns:
-            Path to the created document
+            Path to the created document, or the list of paths of the
+            created parts when max_files_per_doc or max_bytes_per_doc is set
         """
         print(f"Scanning codebase: {self.codebase_path}")
-        files = self._get_files()
+        files, sizes = self._get_files()
         
         if not files:
             raise ValueError("No files found to convert!")
         
         print(f"Found {len(files)} files to convert")
         
-        # Create document
-        doc = Document()
-        
-        # Set default font
-        style = doc.styles['Normal']
-        font = style.font
-        font.name = 'Calibri'
-        font.size = Pt(11)
-        
-        # Add title
-        self._add_title(doc, f"Codebase: {self.codebase_path.name}")
-        doc.add_paragraph(f"Total files: {len(files)}")
-        doc.add_page_break()
-        
-        # Add table of contents
-        if self.include_toc:
-            self._add_table_of_contents(doc, files)
-        
-        # Add each file
-        for idx, file_path in enumerate(files, 1):
-            if progress_callback:
-                progress_callback(idx, len(files), file_path.name)
-            
-            print(f"Processing [{idx}/{len(files)}]: {file_path.name}")
-            self._add_file_content(doc, file_path)
-            
-            # Add page break between files (except last one)
-            if idx < len(files):
-                doc.add_page_break()
+        # Split into several documents if requested; each one is saved and
+        # released before the next is built, bounding memory use
+        parts = self._split_files(files, sizes)
+        if self._is_split:
+            output_paths = [self._part_path(n) for n in range(1, len(parts) + 1)]
+        else:
+            output_paths = [self.output_path]
         
-        # Save document
-        doc.save(self.output_path)
-        print(f"\nDocument saved: {self.output_path}")
+        # Add each file. Reads run in a thread pool ahead of the file being
+        # written, while the document itself is only touched from this
+        # thread (python-docx is not thread-safe).
+        with ThreadPoolExecutor(max_workers=self.read_workers) as pool:
+            reads = self._read_ahead(pool, files, sizes)
+            idx = 0
+            for part_no, (part_files, part_path) in enumerate(zip(parts, output_paths), 1):
+                # Create document
+                title = f"Codebase: {self.codebase_path.name}"
+                if self._is_split:
+                    title += f" (part {part_no} of {len(parts)})"
+                    summary = f"Files in this part: {len(part_files)} of {len(files)}"
+                else:
+                    summary = f"Total files: {len(files)}"
+                doc = self._create_document(part_files, title, summary)
+                # Duplicates may only refer to files in the same part
+                self._seen_content.clear()
+                xml_bound = 0
+                
+                for file_path in part_files:
+                    size = sizes[idx]
+                    if self.max_file_bytes is not None:
+                        size = min(size, self.max_file_bytes)
+                    xml_bound += size * _XML_EXPANSION + _XML_PER_FILE
+                    idx += 1
+                    content = next(reads)
+                    
+                    file_name = os.path.basename(file_path)
+                    if progress_callback:
+                        progress_callback(idx, len(files), file_name)
+                    
+                    # Console output is throttled; the callback still sees every file
+                    if idx % self.PROGRESS_INTERVAL == 0 or idx == len(files):
+                        print(f"Processing [{idx}/{len(files)}]: {file_name}")
+                    self._add_file_content(doc, file_path, content)
+                
+                # Save document; Zip64 headers only when document.xml could
+                # be too large for a plain zip entry
+                _save_docx(doc, part_path, self.compresslevel,
+                           zip64=xml_bound >= zipfile.ZIP64_LIMIT)
+                print(f"\nDocument saved: {part_path}")
         
-        return self.output_path
+        return output_paths if self._is_split else self.output_path
     
     def author(self) -> str:
         """Return the author of the codebase converter."""
@@ -224,7 +657,13 @@ def convert_codebase(codebase_path: str,
                     include_file_paths: bool = True,
                     include_toc: bool = True,
                     ignore_dirs: Optional[Set[str]] = None,
-                    include_extensions: Optional[Set[str]] = None):
+                    include_extensions: Optional[Set[str]] = None,
+                    read_workers: Optional[int] = None,
+                    max_file_bytes: Optional[int] = 2 * 1024 * 1024,
+                    max_files_per_doc: Optional[int] = None,
+                    max_bytes_per_doc: Optional[int] = None,
+                    skip_duplicates: bool = True,
+                    compresslevel: int = 1):
     """
     Convert a codebase to a Word document.
     
@@ -235,9 +674,15 @@ def convert_codebase(codebase_path: str,
         include_toc: Whether to include table of contents
         ignore_dirs: Additional directories to ignore
         include_extensions: Specific file extensions to include
+        read_workers: Number of files read concurrently
+        max_file_bytes: Files larger than this are truncated (None = no limit)
+        max_files_per_doc: Maximum number of files per output document
+        max_bytes_per_doc: Maximum bytes of file content per output document
+        skip_duplicates: Whether to replace repeated files with a reference
+        compresslevel: Deflate level of the saved document, 0-9
     
     Returns:
-        Path to the created document
+        Path to the created document, or list of paths if the output is split
     """
     converter = CodebaseConverter(
         codebase_path=codebase_path,
@@ -245,7 +690,13 @@ def convert_codebase(codebase_path: str,
         include_file_paths=include_file_paths,
         include_toc=include_toc,
         ignore_dirs=ignore_dirs,
-        include_extensions=include_extensions
+        include_extensions=include_extensions,
+        read_workers=read_workers,
+        max_file_bytes=max_file_bytes,
+        max_files_per_doc=max_files_per_doc,
+        max_bytes_per_doc=max_bytes_per_doc,
+        skip_duplicates=skip_duplicates,
+        compresslevel=compresslevel
     )
     
     return converter.convert()